@@ -0,0 +1,90 @@
+"""
+A2A Message Parsing Benchmark
+
+Measures per-request CPU time for parsing a large "modify" request and
+encoding its result, comparing the previous json.loads/.get/json.dumps path
+with the typed models in utils.a2a_messages.
+
+Run from the agents directory:
+
+    uv run python -m benchmarks.bench_a2a_messages
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+from utils.a2a_messages import encode_response, parse_request
+
+ITERATIONS = 200
+CODE_SIZE_KB = 256
+
+
+def make_component_code(size_kb: int) -> str:
+    """Build a TSX component of roughly size_kb kilobytes."""
+    line = '  <div className="flex items-center gap-2">{"label"}\t</div>\n'
+    body = line * (size_kb * 1024 // len(line))
+    return "export function Big() {\n  return (\n" + body + "  );\n}\n"
+
+
+def text_part(text: str) -> SimpleNamespace:
+    """Mimic an A2A text part."""
+    return SimpleNamespace(root=SimpleNamespace(text=text))
+
+
+def legacy_roundtrip(parts: list[SimpleNamespace]) -> str:
+    """Previous executor path: json.loads, .get lookups and json.dumps."""
+    request_data = json.loads(parts[0].root.text)
+    code = request_data.get("code", "")
+    request = request_data.get("request", "")
+    result = {
+        "code": code,
+        "language": "typescript",
+        "modification_applied": request,
+        "status": "success",
+    }
+    return json.dumps(result)
+
+
+def typed_roundtrip(parts: list[SimpleNamespace]) -> str:
+    """Typed path: validated request model and precompiled serializer."""
+    request = parse_request(parts)
+    result = {
+        "code": request.code,
+        "language": "typescript",
+        "modification_applied": request.request,
+        "status": "success",
+    }
+    return encode_response(result)
+
+
+def cpu_time_per_call(fn, parts: list[SimpleNamespace]) -> float:
+    """Return mean process CPU time per call in milliseconds."""
+    fn(parts)
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        fn(parts)
+    return (time.process_time() - start) / ITERATIONS * 1000
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    code = make_component_code(CODE_SIZE_KB)
+    request = "Add dark mode support to every row"
+    single_part = [text_part(json.dumps({"action": "modify", "code": code, "request": request}))]
+    multi_part = [text_part(json.dumps({"action": "modify", "request": request})), text_part(code)]
+
+    baseline = cpu_time_per_call(legacy_roundtrip, single_part)
+    results = [
+        ("legacy json (single part)", baseline),
+        ("typed models (single part)", cpu_time_per_call(typed_roundtrip, single_part)),
+        ("typed models (code as raw part)", cpu_time_per_call(typed_roundtrip, multi_part)),
+    ]
+
+    print(f"modify payload: {len(code) / 1024:.0f} KiB code, {ITERATIONS} iterations")
+    for name, ms in results:
+        print(f"  {name:<34} {ms:8.3f} ms/request  ({baseline / ms:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,15 @@ by the orchestrator agent and other agents.
 """
 
 import os
-import json
+import sys
+import asyncio
+import argparse
+import hashlib
+import contextlib
 import uvicorn
 from typing import Optional, Any
 from dotenv import load_dotenv
+from pydantic import ValidationError
 
 # Load environment variables
 load_dotenv()
@@ -27,6 +32,9 @@ try:
     from a2a.server.tasks import InMemoryTaskStore
     from a2a.server.agent_execution import AgentExecutor, RequestContext
     from a2a.types import AgentCapabilities, AgentCard, AgentSkill
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
     HAS_A2A = True
 except ImportError:
     HAS_A2A = False
@@ -42,6 +50,45 @@ except ImportError:
     print("⚠️  LangChain not installed. Run 'uv sync' to install dependencies.")
 
 from utils.a2a_setup import create_agent_skill, create_agent_card, get_agent_urls
+from utils.a2a_messages import (
+    GenerateRequest,
+    ModifyRequest,
+    encode_response,
+    encode_validation_error,
+    parse_request,
+)
+from utils.generation_cache import (
+    GenerationCache,
+    make_spec_key,
+    setup_generation_cache_environment,
+    spec_identity,
+)
+from utils.warmup import WarmupState, load_manifest, run_warmup
+
+# Prompt for generate_component. Its hash is part of the generation cache key,
+# so editing the prompt invalidates previously cached components.
+GENERATE_PROMPT = """
+Generate a production-ready React component with the following specifications:
+
+**Component Name**: {component_name}
+**Type**: {component_type}
+**Description**: {description}
+**Base**: {base}
+
+Requirements:
+1. Use TypeScript with full type safety
+2. Export as named export
+3. Include JSDoc comments
+4. Use React 19 features (hooks, suspense)
+5. Follow Next.js best practices
+6. Include proper error handling
+7. Make it responsive
+8. Add accessibility features
+
+Return ONLY valid TypeScript code, no markdown, no explanations.
+Make sure the component is immediately usable.
+        """
+GENERATE_PROMPT_VERSION = hashlib.sha256(GENERATE_PROMPT.encode("utf-8")).hexdigest()[:12]
 
 
 class ComponentBuilderAgent:
@@ -49,13 +96,30 @@ class ComponentBuilderAgent:
     Main agent class for component generation using OpenAI + LangGraph.
     """
     
-    def __init__(self):
-        """Initialize the component builder agent."""
+    def __init__(
+        self,
+        cache: Optional[GenerationCache] = None,
+        manifest: Optional[list[dict[str, Any]]] = None,
+    ):
+        """
+        Initialize the component builder agent.
+        
+        Args:
+            cache: Optional generation cache consulted before calling the LLM
+            manifest: Optional warm-up manifest specs; requests without a
+                description for a manifest component use its description
+        """
         if not HAS_LANGCHAIN:
             raise RuntimeError("LangChain not installed")
         
+        self.model = "gpt-4o-mini"
+        self.prompt_version = GENERATE_PROMPT_VERSION
+        self.cache = cache
+        self.manifest_descriptions = {
+            spec_identity(spec): spec.get("description", "") for spec in manifest or []
+        }
         self.llm = ChatOpenAI(
-            model="gpt-4o-mini",
+            model=self.model,
             temperature=0.7,
         )
     
@@ -78,27 +142,32 @@ class ComponentBuilderAgent:
         Returns:
             Generated component code and metadata
         """
-        prompt = f"""
-Generate a production-ready React component with the following specifications:
-
-**Component Name**: {component_name}
-**Type**: {component_type}
-**Description**: {description}
-**Base**: {"shadcn/ui components" if shadcn_based else "Custom React"}
-
-Requirements:
-1. Use TypeScript with full type safety
-2. Export as named export
-3. Include JSDoc comments
-4. Use React 19 features (hooks, suspense)
-5. Follow Next.js best practices
-6. Include proper error handling
-7. Make it responsive
-8. Add accessibility features
-
-Return ONLY valid TypeScript code, no markdown, no explanations.
-Make sure the component is immediately usable.
-        """
+        spec = {
+            "component_name": component_name,
+            "description": description,
+            "type": component_type,
+            "shadcn_based": shadcn_based,
+        }
+        
+        # A request without a description for a manifest component is the
+        # manifest spec, so it can be served from the warmed cache entry
+        if not description.strip():
+            description = self.manifest_descriptions.get(spec_identity(spec), description)
+            spec["description"] = description
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_spec_key(spec, self.model, self.prompt_version)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return {**cached, "component_name": component_name}
+        
+        prompt = GENERATE_PROMPT.format(
+            component_name=component_name,
+            component_type=component_type,
+            description=description,
+            base="shadcn/ui components" if shadcn_based else "Custom React",
+        )
         
         try:
             response = await self.llm.ainvoke([HumanMessage(content=prompt)])
@@ -110,7 +179,7 @@ Make sure the component is immediately usable.
             elif "```typescript" in code:
                 code = code.split("```typescript")[1].split("```")[0].strip()
             
-            return {
+            result = {
                 "component_name": component_name,
                 "code": code,
                 "language": "typescript",
@@ -118,6 +187,9 @@ Make sure the component is immediately usable.
                 "type": component_type,
                 "status": "success",
             }
+            if cache_key is not None:
+                self.cache.set(cache_key, result)
+            return result
         except Exception as e:
             return {
                 "component_name": component_name,
@@ -193,9 +265,30 @@ class ComponentBuilderExecutor(AgentExecutor):
     - Sending results back via event queue
     """
     
-    def __init__(self):
+    def __init__(self, agent: Optional[ComponentBuilderAgent] = None):
         """Initialize the executor with a ComponentBuilderAgent instance."""
-        self.agent = ComponentBuilderAgent()
+        self.agent = agent or ComponentBuilderAgent()
+        # One handler per request model in ComponentRequest
+        self.handlers = {
+            GenerateRequest: self.handle_generate,
+            ModifyRequest: self.handle_modify,
+        }
+    
+    async def handle_generate(self, request: GenerateRequest) -> dict[str, Any]:
+        """Generate a component for a validated generate request."""
+        return await self.agent.generate_component(
+            component_name=request.component_name,
+            description=request.description,
+            component_type=request.component_type,
+            shadcn_based=request.shadcn_based,
+        )
+    
+    async def handle_modify(self, request: ModifyRequest) -> dict[str, Any]:
+        """Modify a component for a validated modify request."""
+        return await self.agent.modify_component(
+            component_code=request.code,
+            modification_request=request.request,
+        )
     
     async def execute(
         self,
@@ -209,39 +302,31 @@ class ComponentBuilderExecutor(AgentExecutor):
             context: Request context containing the message
             event_queue: Queue for sending response events
         """
+        # Validate the request before any LLM work starts
         try:
-            # Parse the request message
-            message_text = context.message.parts[0].root.text
-            
-            # Parse JSON request (expected format)
-            request_data = json.loads(message_text)
-            action = request_data.get("action", "generate")
-            
-            if action == "generate":
-                result = await self.agent.generate_component(
-                    component_name=request_data.get("component_name", "Component"),
-                    description=request_data.get("description", ""),
-                    component_type=request_data.get("type", "ui"),
-                    shadcn_based=request_data.get("shadcn_based", True),
-                )
-            elif action == "modify":
-                result = await self.agent.modify_component(
-                    component_code=request_data.get("code", ""),
-                    modification_request=request_data.get("request", ""),
-                )
-            else:
-                result = {"error": f"Unknown action: {action}"}
+            request = parse_request(context.message.parts)
+        except ValidationError as e:
+            await event_queue.enqueue_event(encode_validation_error(e))
+            return
+        except Exception as e:
+            await event_queue.enqueue_event(
+                encode_response({"error": f"Invalid request: {e}", "status": "error"})
+            )
+            return
+        
+        try:
+            result = await self.handlers[type(request)](request)
             
             # Send result back through A2A event queue
             # (Implementation depends on A2A library version)
-            await event_queue.enqueue_event(json.dumps(result))
+            await event_queue.enqueue_event(encode_response(result))
             
         except Exception as e:
             error_result = {
                 "error": str(e),
                 "status": "error",
             }
-            await event_queue.enqueue_event(json.dumps(error_result))
+            await event_queue.enqueue_event(encode_response(error_result))
     
     async def cancel(
         self,
@@ -292,6 +377,54 @@ def create_agent_card_for_component_builder(port: int) -> dict[str, Any]:
     )
 
 
+def create_health_route(warmup_state: WarmupState) -> "Route":
+    """
+    Create the /health route reporting cache warm-up readiness.
+    
+    Returns 503 while warm-up is below its readiness threshold, so a load
+    balancer can hold traffic until the most common components are cached.
+    """
+    async def health_check(request: Request) -> JSONResponse:
+        """Health check endpoint."""
+        ready = warmup_state.is_ready
+        return JSONResponse(
+            {
+                "status": "healthy" if ready else "warming",
+                "agent": "component_builder",
+                "protocol": "A2A",
+                "warmup": warmup_state.to_dict(),
+            },
+            status_code=200 if ready else 503,
+        )
+    
+    return Route("/health", health_check, methods=["GET"])
+
+
+def create_warmup_lifespan(
+    agent: ComponentBuilderAgent,
+    specs: list[dict[str, Any]],
+    warmup_state: WarmupState,
+    concurrency: int,
+):
+    """Create a server lifespan that runs cache warm-up in the background."""
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        task = None
+        if specs:
+            task = asyncio.create_task(
+                run_warmup(agent, specs, warmup_state, concurrency)
+            )
+        try:
+            yield
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+    
+    return lifespan
+
+
 def main():
     """Main entry point for the component builder agent."""
     print("🔧 Setting up Component Builder Agent (LangGraph + A2A)...")
@@ -309,16 +442,37 @@ def main():
     if not HAS_A2A:
         raise RuntimeError("A2A Protocol not installed")
     
+    cache_config = setup_generation_cache_environment()
+    
     try:
         print("📝 Creating Component Builder Agent...")
         
         # Create the agent card
         agent_card = create_agent_card_for_component_builder(port)
         
+        # Load the warm-up manifest, if configured; warm-up is optional, so a
+        # missing or invalid manifest must not stop the agent from serving
+        specs = []
+        if cache_config["warmup_manifest"]:
+            try:
+                specs = load_manifest(cache_config["warmup_manifest"])
+                print(f"🔥 Warming cache with {len(specs)} component specs in the background...")
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Warning: skipping cache warm-up: {e}")
+        
+        # Create the agent with its generation cache
+        cache = GenerationCache(cache_config["cache_dir"], cache_config["ttl_seconds"])
+        agent = ComponentBuilderAgent(cache=cache, manifest=specs)
+        
+        warmup_state = WarmupState(
+            total=len(specs),
+            ready_threshold=cache_config["warmup_ready_threshold"],
+        )
+        
         # Create the A2A request handler
         print("🔌 Setting up A2A Protocol...")
         request_handler = DefaultRequestHandler(
-            agent_executor=ComponentBuilderExecutor(),
+            agent_executor=ComponentBuilderExecutor(agent),
             task_store=InMemoryTaskStore(),
         )
         
@@ -332,11 +486,18 @@ def main():
         # Start the server
         print(f"✅ Starting Component Builder Agent on http://localhost:{port}")
         print(f"   A2A Protocol endpoint: http://localhost:{port}/")
+        print(f"   Health check: http://localhost:{port}/health")
         print()
         print("Agent is ready to receive requests from orchestrator!")
         print()
         
-        uvicorn.run(server.build(), host="0.0.0.0", port=port, log_level="info")
+        app = server.build(
+            routes=[create_health_route(warmup_state)],
+            lifespan=create_warmup_lifespan(
+                agent, specs, warmup_state, cache_config["warmup_concurrency"]
+            ),
+        )
+        uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -346,5 +507,51 @@ def main():
         raise
 
 
+def warmup_main(argv: Optional[list[str]] = None):
+    """
+    Entry point for pre-generating a component spec manifest into the cache.
+    
+    Safe to interrupt: completed generations are persisted as they finish and
+    specs that are already fresh are skipped on the next run.
+    """
+    cache_config = setup_generation_cache_environment()
+    
+    parser = argparse.ArgumentParser(
+        prog="component_builder_agent.py warmup",
+        description="Pre-generate component specs into the generation cache",
+    )
+    parser.add_argument(
+        "manifest",
+        nargs="?",
+        default=cache_config["warmup_manifest"] or None,
+        help="Path to the component spec manifest (default: $WARMUP_MANIFEST)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=cache_config["warmup_concurrency"],
+        help="Maximum number of concurrent generations",
+    )
+    args = parser.parse_args(argv)
+    
+    if not args.manifest:
+        parser.error("a manifest path is required (or set WARMUP_MANIFEST)")
+    
+    specs = load_manifest(args.manifest)
+    cache = GenerationCache(cache_config["cache_dir"], cache_config["ttl_seconds"])
+    agent = ComponentBuilderAgent(cache=cache, manifest=specs)
+    state = WarmupState(total=len(specs), ready_threshold=cache_config["warmup_ready_threshold"])
+    
+    print(f"🔥 Warming generation cache with {len(specs)} component specs...")
+    asyncio.run(run_warmup(agent, specs, state, args.concurrency))
+    print(
+        f"✅ Warm-up finished: {state.cached}/{state.total} cached "
+        f"({state.generated} generated, {state.failed} failed)"
+    )
+
+
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] == ["warmup"]:
+        warmup_main(sys.argv[2:])
+    else:
+        main()
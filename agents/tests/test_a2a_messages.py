@@ -0,0 +1,174 @@
+"""Tests for A2A request parsing and response encoding."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from utils.a2a_messages import (
+    GenerateRequest,
+    ModifyRequest,
+    encode_response,
+    encode_validation_error,
+    parse_request,
+)
+
+
+def text_part(text):
+    return SimpleNamespace(root=SimpleNamespace(text=text))
+
+
+def data_part(data):
+    return SimpleNamespace(root=SimpleNamespace(data=data))
+
+
+def file_part():
+    return SimpleNamespace(root=SimpleNamespace(file="f"))
+
+
+def error_types(error: ValidationError) -> list[str]:
+    return [e["type"] for e in error.errors()]
+
+
+def test_missing_action_defaults_to_generate():
+    request = parse_request([text_part('{"component_name": "Button", "type": "form"}')])
+
+    assert isinstance(request, GenerateRequest)
+    assert request.component_name == "Button"
+    assert request.component_type == "form"
+    assert request.shadcn_based is True
+
+
+def test_modify_request_in_single_part():
+    request = parse_request([text_part('{"action": "modify", "code": "c", "request": "r"}')])
+
+    assert isinstance(request, ModifyRequest)
+    assert (request.code, request.request) == ("c", "r")
+
+
+def test_modify_code_joined_from_text_parts():
+    parts = [text_part('{"action": "modify", "request": "r"}'), text_part("a"), text_part("b")]
+
+    assert parse_request(parts).code == "ab"
+
+
+def test_data_part_with_text_parts():
+    parts = [data_part({"action": "modify", "request": "r"}), text_part("code")]
+    request = parse_request(parts)
+
+    assert isinstance(request, ModifyRequest)
+    assert request.code == "code"
+
+
+def test_unknown_action_is_rejected():
+    with pytest.raises(ValidationError) as exc:
+        parse_request([text_part('{"action": "delete"}')])
+
+    assert error_types(exc.value) == ["unknown_action"]
+
+
+@pytest.mark.parametrize("text", ["{bad", "[1]", '"string"'])
+def test_malformed_head_is_a_validation_error(text):
+    with pytest.raises(ValidationError):
+        parse_request([text_part(text)])
+
+
+def test_malformed_head_has_same_shape_in_multi_part_path():
+    with pytest.raises(ValidationError) as exc:
+        parse_request([text_part("{bad"), text_part("code")])
+
+    assert error_types(exc.value) == ["json_invalid"]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        '{"shadcn_based": "yes"}',
+        '{"shadcn_based": "no"}',
+        '{"shadcn_based": 1}',
+        '{"component_name": 5}',
+        '{"type": null}',
+        '{"action": "modify", "code": 1, "request": "r"}',
+        '{"action": "modify", "code": "c", "request": ["r"]}',
+    ],
+)
+def test_wrong_field_types_are_not_coerced(payload):
+    with pytest.raises(ValidationError):
+        parse_request([text_part(payload)])
+
+
+def test_empty_code_on_modify_is_rejected():
+    with pytest.raises(ValidationError) as exc:
+        parse_request([text_part('{"action": "modify", "code": "", "request": "r"}')])
+
+    assert error_types(exc.value) == ["string_too_short"]
+
+
+def test_code_in_head_and_parts_is_rejected():
+    parts = [text_part('{"action": "modify", "code": "c", "request": "r"}'), text_part("more")]
+
+    with pytest.raises(ValidationError) as exc:
+        parse_request(parts)
+
+    assert error_types(exc.value) == ["code_conflict"]
+
+
+def test_extra_parts_on_generate_are_rejected():
+    with pytest.raises(ValidationError) as exc:
+        parse_request([text_part('{"component_name": "Button"}'), text_part("code")])
+
+    assert error_types(exc.value) == ["unexpected_parts"]
+
+
+def test_non_text_extra_part_is_rejected():
+    with pytest.raises(ValidationError) as exc:
+        parse_request([text_part('{"action": "modify", "request": "r"}'), file_part()])
+
+    assert error_types(exc.value) == ["unsupported_part"]
+
+
+def test_unsupported_first_part_raises_value_error():
+    with pytest.raises(ValueError, match="First part must be a text or data part"):
+        parse_request([file_part()])
+
+
+def test_empty_message_raises_value_error():
+    with pytest.raises(ValueError):
+        parse_request([])
+
+
+def test_validation_error_encoding_omits_input():
+    with pytest.raises(ValidationError) as exc:
+        parse_request([text_part('{"action": "modify", "code": "c"}')])
+
+    encoded = json.loads(encode_validation_error(exc.value))
+
+    assert encoded["status"] == "error"
+    assert encoded["details"][0]["loc"] == ["modify", "request"]
+    assert "input" not in encoded["details"][0]
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        {
+            "component_name": "Button",
+            "code": "export function Button() {}",
+            "language": "typescript",
+            "framework": "react",
+            "type": "ui",
+            "status": "success",
+        },
+        {
+            "code": "export function Button() {}",
+            "language": "typescript",
+            "modification_applied": "Add a loading state",
+            "status": "success",
+        },
+        {"component_name": "Button", "error": "boom", "status": "error"},
+        {"code": "c", "status": "success", "new_field": {"nested": [1, 2]}},
+    ],
+)
+def test_encode_response_keeps_every_field(result):
+    assert json.loads(encode_response(result)) == result
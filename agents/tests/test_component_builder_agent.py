@@ -0,0 +1,200 @@
+"""Tests for the component builder's generation cache, health route and warm-up lifespan."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from component_builder_agent import (
+    ComponentBuilderAgent,
+    create_health_route,
+    create_warmup_lifespan,
+)
+from utils.generation_cache import GenerationCache
+from utils.warmup import WarmupState, run_warmup
+
+MANIFEST = [
+    {
+        "component_name": "Button",
+        "description": "Button with variants and sizes",
+        "type": "ui",
+        "shadcn_based": True,
+    }
+]
+
+
+class FakeLLM:
+    """Stand-in for ChatOpenAI that returns canned code."""
+
+    def __init__(self, fail=False, block=False):
+        self.fail = fail
+        self.block = block
+        self.prompts = []
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def ainvoke(self, messages):
+        self.prompts.append(messages[0].content)
+        self.started.set()
+        if self.block:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        if self.fail:
+            raise RuntimeError("llm down")
+        return SimpleNamespace(content=f"```tsx\nexport const C{len(self.prompts)} = 1\n```")
+
+
+@pytest.fixture
+def make_agent(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    def make(llm=None, manifest=None, cache=True):
+        agent = ComponentBuilderAgent(
+            cache=GenerationCache(str(tmp_path)) if cache else None,
+            manifest=manifest,
+        )
+        agent.llm = llm or FakeLLM()
+        return agent
+
+    return make
+
+
+async def test_cache_hit_skips_llm(make_agent):
+    agent = make_agent()
+
+    first = await agent.generate_component("Button", "primary button")
+    second = await agent.generate_component("Button", "primary button")
+
+    assert first["status"] == "success"
+    assert second == first
+    assert len(agent.llm.prompts) == 1
+
+
+async def test_different_description_is_not_served_from_cache(make_agent):
+    agent = make_agent()
+
+    first = await agent.generate_component("Button", "primary button")
+    second = await agent.generate_component("Button", "button with a loading spinner")
+
+    assert second["code"] != first["code"]
+    assert len(agent.llm.prompts) == 2
+    assert "loading spinner" in agent.llm.prompts[1]
+
+
+async def test_errors_are_not_cached(make_agent):
+    agent = make_agent(llm=FakeLLM(fail=True))
+
+    result = await agent.generate_component("Button", "primary button")
+    assert result["status"] == "error"
+
+    agent.llm = FakeLLM()
+    result = await agent.generate_component("Button", "primary button")
+
+    assert result["status"] == "success"
+    assert len(agent.llm.prompts) == 1
+
+
+async def test_agent_without_cache_always_calls_llm(make_agent):
+    agent = make_agent(cache=False)
+
+    await agent.generate_component("Button", "primary button")
+    await agent.generate_component("Button", "primary button")
+
+    assert len(agent.llm.prompts) == 2
+
+
+async def test_request_without_description_hits_warmed_manifest_entry(make_agent):
+    agent = make_agent(manifest=MANIFEST)
+    state = await run_warmup(agent, MANIFEST, WarmupState(total=1))
+    assert state.generated == 1
+
+    result = await agent.generate_component("button", "")
+
+    assert result["status"] == "success"
+    assert result["component_name"] == "button"
+    assert len(agent.llm.prompts) == 1
+
+
+async def test_request_without_description_uses_manifest_description(make_agent):
+    agent = make_agent(manifest=MANIFEST)
+
+    await agent.generate_component("Button", "")
+
+    assert "Button with variants and sizes" in agent.llm.prompts[0]
+
+
+def make_health_client(state):
+    return TestClient(Starlette(routes=[create_health_route(state)]))
+
+
+def test_health_is_503_while_warming():
+    state = WarmupState(total=10, ready_threshold=0.8)
+    state.cached = 2
+
+    response = make_health_client(state).get("/health")
+
+    assert response.status_code == 503
+    body = response.json()
+    assert body["status"] == "warming"
+    assert body["warmup"]["cached"] == 2
+    assert body["warmup"]["ready"] is False
+
+
+def test_health_is_200_once_ready():
+    state = WarmupState(total=10, ready_threshold=0.8)
+    state.cached = 8
+
+    response = make_health_client(state).get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+
+def test_health_is_200_without_manifest():
+    response = make_health_client(WarmupState(total=0)).get("/health")
+
+    assert response.status_code == 200
+
+
+def test_lifespan_runs_warmup_in_background(make_agent):
+    agent = make_agent(manifest=MANIFEST)
+    state = WarmupState(total=1)
+    app = Starlette(lifespan=create_warmup_lifespan(agent, MANIFEST, state, concurrency=2))
+
+    async def wait_until_finished():
+        while not state.finished:
+            await asyncio.sleep(0.01)
+
+    with TestClient(app) as client:
+        client.portal.call(asyncio.wait_for, wait_until_finished(), 5)
+
+    assert state.generated == 1
+
+
+def test_lifespan_cancels_warmup_on_shutdown(make_agent):
+    agent = make_agent(llm=FakeLLM(block=True), manifest=MANIFEST)
+    state = WarmupState(total=1)
+    app = Starlette(lifespan=create_warmup_lifespan(agent, MANIFEST, state, concurrency=2))
+
+    with TestClient(app) as client:
+        client.portal.call(agent.llm.started.wait)
+        assert not state.finished
+
+    assert agent.llm.cancelled
+    assert state.cached == 0
+
+
+def test_lifespan_without_specs_starts_nothing(make_agent):
+    agent = make_agent()
+    state = WarmupState(total=0)
+    app = Starlette(lifespan=create_warmup_lifespan(agent, [], state, concurrency=2))
+
+    with TestClient(app):
+        pass
+
+    assert agent.llm.prompts == []
@@ -0,0 +1,130 @@
+"""Tests for dispatching A2A requests in ComponentBuilderExecutor."""
+
+import json
+from types import SimpleNamespace
+from typing import get_args
+
+import pytest
+
+from component_builder_agent import ComponentBuilderExecutor
+from utils.a2a_messages import ComponentRequest
+
+
+class StubAgent:
+    """Records calls instead of running the LLM."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    async def generate_component(self, **kwargs):
+        self.calls.append(("generate", kwargs))
+        if self.fail:
+            raise RuntimeError("boom")
+        return {"component_name": kwargs["component_name"], "code": "c", "status": "success"}
+
+    async def modify_component(self, **kwargs):
+        self.calls.append(("modify", kwargs))
+        return {"code": kwargs["component_code"] + "!", "status": "success"}
+
+
+class FakeEventQueue:
+    """Collects enqueued events as decoded JSON."""
+
+    def __init__(self):
+        self.events = []
+
+    async def enqueue_event(self, event):
+        self.events.append(json.loads(event))
+
+
+def text_part(text):
+    return SimpleNamespace(root=SimpleNamespace(text=text))
+
+
+def make_context(*parts):
+    return SimpleNamespace(message=SimpleNamespace(parts=list(parts)))
+
+
+async def run(executor, *parts):
+    queue = FakeEventQueue()
+    await executor.execute(make_context(*parts), queue)
+    return queue.events
+
+
+async def test_generate_request_is_dispatched():
+    agent = StubAgent()
+    events = await run(
+        ComponentBuilderExecutor(agent),
+        text_part('{"component_name": "Button", "type": "form", "shadcn_based": false}'),
+    )
+
+    assert agent.calls == [
+        (
+            "generate",
+            {
+                "component_name": "Button",
+                "description": "",
+                "component_type": "form",
+                "shadcn_based": False,
+            },
+        )
+    ]
+    assert events == [{"component_name": "Button", "code": "c", "status": "success"}]
+
+
+async def test_modify_request_with_code_part_is_dispatched():
+    agent = StubAgent()
+    events = await run(
+        ComponentBuilderExecutor(agent),
+        text_part('{"action": "modify", "request": "r"}'),
+        text_part("code"),
+    )
+
+    assert agent.calls == [("modify", {"component_code": "code", "modification_request": "r"})]
+    assert events == [{"code": "code!", "status": "success"}]
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [
+        [text_part("{bad")],
+        [text_part('{"action": "delete"}')],
+        [text_part('{"shadcn_based": "yes"}')],
+        [text_part('{"action": "modify", "code": "", "request": "r"}')],
+        [text_part('{"component_name": "Button"}'), text_part("code")],
+    ],
+)
+async def test_invalid_request_is_rejected_before_agent_runs(parts):
+    agent = StubAgent()
+    events = await run(ComponentBuilderExecutor(agent), *parts)
+
+    assert agent.calls == []
+    assert len(events) == 1
+    assert events[0]["status"] == "error"
+    assert events[0]["error"] == "Invalid request"
+    assert events[0]["details"]
+
+
+async def test_unsupported_first_part_enqueues_error_event():
+    agent = StubAgent()
+    file_part = SimpleNamespace(root=SimpleNamespace(file="f"))
+    events = await run(ComponentBuilderExecutor(agent), file_part)
+
+    assert agent.calls == []
+    assert events == [
+        {"error": "Invalid request: First part must be a text or data part", "status": "error"}
+    ]
+
+
+async def test_agent_exception_enqueues_error_event():
+    events = await run(ComponentBuilderExecutor(StubAgent(fail=True)), text_part("{}"))
+
+    assert events == [{"error": "boom", "status": "error"}]
+
+
+def test_every_request_model_has_a_handler():
+    union = get_args(get_args(ComponentRequest)[0])
+    models = {get_args(member)[0] for member in union}
+
+    assert set(ComponentBuilderExecutor(StubAgent()).handlers) == models
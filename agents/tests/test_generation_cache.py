@@ -0,0 +1,92 @@
+"""Tests for the file-backed generation cache."""
+
+import os
+import time
+
+import pytest
+
+from utils.generation_cache import (
+    AGENT_DIR,
+    GenerationCache,
+    make_spec_key,
+    resolve_agent_path,
+)
+
+
+def test_spec_key_normalizes_name_type_and_description():
+    a = make_spec_key(
+        {"component_name": "DropdownMenu", "description": "Menu  with Items", "type": "UI"},
+        "gpt-4o-mini",
+        "v1",
+    )
+    b = make_spec_key(
+        {"component_name": "dropdown-menu", "description": "menu with items ", "type": "ui"},
+        "gpt-4o-mini",
+        "v1",
+    )
+    assert a == b
+
+
+def test_spec_key_depends_on_description():
+    a = make_spec_key({"component_name": "Button", "description": "plain"}, "m", "v1")
+    b = make_spec_key({"component_name": "Button", "description": "with spinner"}, "m", "v1")
+    assert a != b
+
+
+def test_spec_key_changes_with_model_and_prompt_version():
+    spec = {"component_name": "Button"}
+    base = make_spec_key(spec, "gpt-4o-mini", "v1")
+    assert make_spec_key(spec, "gpt-4o", "v1") != base
+    assert make_spec_key(spec, "gpt-4o-mini", "v2") != base
+    assert make_spec_key({**spec, "shadcn_based": False}, "gpt-4o-mini", "v1") != base
+
+
+def test_get_returns_stored_result(tmp_path):
+    cache = GenerationCache(str(tmp_path))
+    cache.set("k", {"code": "x", "status": "success"})
+
+    assert cache.get("k") == {"code": "x", "status": "success"}
+    assert cache.is_fresh("k")
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl(tmp_path, monkeypatch):
+    cache = GenerationCache(str(tmp_path), ttl_seconds=60)
+    cache.set("k", {"code": "x"})
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+
+    assert cache.get("k") is None
+    assert not cache.is_fresh("k")
+
+
+def test_failed_write_keeps_previous_entry_and_no_temp_files(tmp_path):
+    cache = GenerationCache(str(tmp_path))
+    cache.set("k", {"code": "old"})
+
+    with pytest.raises(TypeError):
+        cache.set("k", {"code": object()})
+
+    assert cache.get("k") == {"code": "old"}
+    assert os.listdir(tmp_path) == ["k.json"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["{not json", "[]", "1", '{"created_at": "soon", "result": {}}', '{"created_at": 1e12}'],
+)
+def test_corrupt_entry_is_treated_as_missing(tmp_path, content):
+    cache = GenerationCache(str(tmp_path))
+    (tmp_path / "k.json").write_text(content, encoding="utf-8")
+
+    assert cache.get("k") is None
+    assert not cache.is_fresh("k")
+
+
+def test_relative_paths_resolve_against_agent_dir():
+    assert resolve_agent_path("warmup_manifest.json") == os.path.join(
+        AGENT_DIR, "warmup_manifest.json"
+    )
+    assert resolve_agent_path("/abs/path.json") == "/abs/path.json"
+    assert resolve_agent_path("") == ""
@@ -0,0 +1,132 @@
+"""Tests for the cache warm-up job."""
+
+import asyncio
+
+import pytest
+
+from utils.generation_cache import GenerationCache, make_spec_key
+from utils.warmup import WarmupState, run_warmup
+
+
+class FakeAgent:
+    """Stand-in for ComponentBuilderAgent that writes into its cache."""
+
+    model = "fake-model"
+    prompt_version = "v1"
+
+    def __init__(self, cache, fail=(), raise_for=(), store=True):
+        self.cache = cache
+        self.fail = set(fail)
+        self.raise_for = set(raise_for)
+        self.store = store
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_component(self, component_name, description, component_type, shadcn_based):
+        self.calls.append(component_name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        if component_name in self.raise_for:
+            raise RuntimeError("boom")
+        if component_name in self.fail:
+            return {"error": "llm down", "status": "error"}
+
+        result = {"component_name": component_name, "code": "x", "status": "success"}
+        if self.store:
+            spec = {
+                "component_name": component_name,
+                "description": description,
+                "type": component_type,
+                "shadcn_based": shadcn_based,
+            }
+            self.cache.set(make_spec_key(spec, self.model, self.prompt_version), result)
+        return result
+
+
+def make_specs(count):
+    return [{"component_name": f"Component{i}"} for i in range(count)]
+
+
+async def test_generates_all_specs(tmp_path):
+    agent = FakeAgent(GenerationCache(str(tmp_path)))
+    state = await run_warmup(agent, make_specs(5), WarmupState(total=5))
+
+    assert state.finished
+    assert (state.cached, state.generated, state.failed) == (5, 5, 0)
+
+
+async def test_resume_skips_fresh_specs(tmp_path):
+    cache = GenerationCache(str(tmp_path))
+    specs = make_specs(4)
+
+    await run_warmup(FakeAgent(cache), specs[:2], WarmupState(total=2))
+
+    agent = FakeAgent(cache)
+    state = await run_warmup(agent, specs, WarmupState(total=4))
+
+    assert agent.calls == ["Component2", "Component3"]
+    assert (state.cached, state.generated) == (4, 2)
+
+
+async def test_concurrency_is_bounded(tmp_path):
+    agent = FakeAgent(GenerationCache(str(tmp_path)))
+    await run_warmup(agent, make_specs(10), WarmupState(total=10), concurrency=3)
+
+    assert agent.max_in_flight == 3
+
+
+async def test_failures_and_exceptions_are_counted(tmp_path):
+    agent = FakeAgent(
+        GenerationCache(str(tmp_path)),
+        fail={"Component0"},
+        raise_for={"Component1"},
+    )
+    state = await run_warmup(agent, make_specs(4), WarmupState(total=4))
+
+    assert state.finished
+    assert (state.cached, state.generated, state.failed) == (2, 2, 2)
+
+
+async def test_results_not_in_cache_are_not_counted(tmp_path):
+    agent = FakeAgent(GenerationCache(str(tmp_path)), store=False)
+    state = await run_warmup(agent, make_specs(2), WarmupState(total=2))
+
+    assert (state.cached, state.failed) == (0, 2)
+
+
+async def test_agent_without_cache_is_rejected():
+    with pytest.raises(ValueError):
+        await run_warmup(FakeAgent(None), make_specs(1), WarmupState(total=1))
+
+
+def test_ready_once_threshold_is_reached():
+    state = WarmupState(total=10, ready_threshold=0.8)
+    assert not state.is_ready
+
+    state.cached = 7
+    assert not state.is_ready
+
+    state.cached = 8
+    assert state.is_ready
+
+
+def test_finished_run_is_ready_below_threshold():
+    state = WarmupState(total=10, ready_threshold=0.8)
+    state.cached = 1
+    state.finished = True
+
+    assert state.is_ready
+
+
+def test_empty_manifest_is_ready():
+    state = WarmupState(total=0)
+
+    assert state.finished
+    assert state.is_ready
+    assert state.progress == 1.0
@@ -0,0 +1,159 @@
+"""
+A2A Message Models
+
+This module provides typed request and response models for the component
+builder's A2A messages. Validators and serializers are built once at import
+time, and each request is parsed and checked before any LLM work starts.
+"""
+
+from typing import Annotated, Any, Literal, Optional, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    TypeAdapter,
+    ValidationError,
+)
+from pydantic_core import PydanticCustomError
+
+
+class GenerateRequest(BaseModel):
+    """Request to generate a new component."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True, strict=True)
+
+    action: Literal["generate"] = "generate"
+    component_name: str = "Component"
+    description: str = ""
+    component_type: str = Field(default="ui", alias="type")
+    shadcn_based: bool = True
+
+
+class ModifyRequest(BaseModel):
+    """Request to modify an existing component."""
+
+    model_config = ConfigDict(extra="ignore", strict=True)
+
+    action: Literal["modify"]
+    code: str = Field(min_length=1)
+    request: str = Field(min_length=1)
+
+
+def _request_action(value: Any) -> Optional[str]:
+    """Pick the request model by action, defaulting to "generate"."""
+    if isinstance(value, dict):
+        return value.get("action", "generate")
+    return getattr(value, "action", None)
+
+
+# Add new actions to this union with their own Tag, and a handler in
+# ComponentBuilderExecutor.handlers.
+ComponentRequest = Annotated[
+    Union[
+        Annotated[GenerateRequest, Tag("generate")],
+        Annotated[ModifyRequest, Tag("modify")],
+    ],
+    Discriminator(
+        _request_action,
+        custom_error_type="unknown_action",
+        custom_error_message="Unknown action",
+    ),
+]
+
+
+# Results are plain dicts so new actions can add fields without touching this module.
+ComponentResponse = dict[str, Any]
+
+REQUEST_ADAPTER: TypeAdapter[Union[GenerateRequest, ModifyRequest]] = TypeAdapter(ComponentRequest)
+REQUEST_HEAD_ADAPTER: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+RESPONSE_ADAPTER: TypeAdapter[ComponentResponse] = TypeAdapter(ComponentResponse)
+
+
+def _request_error(error_type: str, message: str, loc: tuple = ()) -> ValidationError:
+    """Build a ValidationError with the same shape as model validation errors."""
+    return ValidationError.from_exception_data(
+        "ComponentRequest",
+        [{"type": PydanticCustomError(error_type, message), "loc": loc, "input": None}],
+    )
+
+
+def parse_request(parts: list[Any]) -> Union[GenerateRequest, ModifyRequest]:
+    """
+    Parse and validate a component request from A2A message parts.
+
+    The first part holds the request, either as a JSON object in a text part
+    or as a data part. A modify request may instead send its `code` as further
+    text parts, which are joined without JSON escaping; `code` must then be
+    absent from the first part.
+
+    Args:
+        parts: A2A message parts
+
+    Returns:
+        Validated request model
+
+    Raises:
+        ValueError: If the message has no parts or the first part is neither
+            a text nor a data part
+        pydantic.ValidationError: If the request is malformed
+    """
+    if not parts:
+        raise ValueError("Message has no parts")
+
+    head = getattr(parts[0], "root", parts[0])
+    head_data = getattr(head, "data", None)
+    head_text = getattr(head, "text", None)
+
+    if head_data is not None:
+        data = REQUEST_HEAD_ADAPTER.validate_python(head_data)
+    elif head_text is not None:
+        data = REQUEST_HEAD_ADAPTER.validate_json(head_text)
+    else:
+        raise ValueError("First part must be a text or data part")
+
+    if len(parts) > 1:
+        code_parts = []
+        for index, part in enumerate(parts[1:], start=1):
+            text = getattr(getattr(part, "root", part), "text", None)
+            if text is None:
+                raise _request_error(
+                    "unsupported_part", "Additional parts must be text parts", ("parts", index)
+                )
+            code_parts.append(text)
+
+        if data.get("action", "generate") != "modify":
+            raise _request_error(
+                "unexpected_parts", "Only modify requests accept additional parts", ("parts",)
+            )
+        if "code" in data:
+            raise _request_error(
+                "code_conflict",
+                "Send code either in the request or as additional parts, not both",
+                ("modify", "code"),
+            )
+        data["code"] = "".join(code_parts)
+
+    return REQUEST_ADAPTER.validate_python(data)
+
+
+def encode_response(result: ComponentResponse) -> str:
+    """Serialize a result for the A2A event queue."""
+    return RESPONSE_ADAPTER.dump_json(result).decode("utf-8")
+
+
+def encode_validation_error(error: ValidationError) -> str:
+    """Serialize a request validation failure for the A2A event queue."""
+    return encode_response(
+        {
+            "error": "Invalid request",
+            "details": error.errors(
+                include_url=False,
+                include_context=False,
+                include_input=False,
+            ),
+            "status": "error",
+        }
+    )
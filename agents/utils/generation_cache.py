@@ -0,0 +1,170 @@
+"""
+Generation Cache Utilities
+
+This module provides a small file-backed cache for generated components, so the
+component builder can serve common specs without paying full LLM latency and a
+warm-up job can pre-populate it after a deploy.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Any, Optional
+
+# Relative paths in the configuration are resolved against the agents
+# directory, so the server behaves the same whatever directory it starts in.
+AGENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_agent_path(path: str) -> str:
+    """Resolve a relative path against the agents directory."""
+    if not path or os.path.isabs(path):
+        return path
+    return os.path.join(AGENT_DIR, path)
+
+
+def setup_generation_cache_environment() -> dict[str, Any]:
+    """
+    Set up and validate generation cache and warm-up environment variables.
+
+    Returns:
+        Dictionary with generation cache configuration
+    """
+    config = {
+        "cache_dir": resolve_agent_path(os.getenv("GENERATION_CACHE_DIR", ".cache/generations")),
+        "ttl_seconds": int(os.getenv("GENERATION_CACHE_TTL_SECONDS", "604800")),
+        "warmup_manifest": resolve_agent_path(os.getenv("WARMUP_MANIFEST", "")),
+        "warmup_concurrency": int(os.getenv("WARMUP_CONCURRENCY", "4")),
+        "warmup_ready_threshold": float(os.getenv("WARMUP_READY_THRESHOLD", "0.8")),
+    }
+
+    return config
+
+
+def normalize_component_name(name: str) -> str:
+    """
+    Normalize a component name for cache lookups.
+
+    "DropdownMenu", "dropdown-menu" and "Dropdown Menu" all map to "dropdownmenu".
+    """
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def normalize_description(description: str) -> str:
+    """Normalize a description for cache lookups (case and whitespace)."""
+    return " ".join(description.lower().split())
+
+
+def spec_identity(spec: dict[str, Any]) -> tuple[str, str, bool]:
+    """
+    Identify a spec by its normalized name, type and shadcn_based flag.
+
+    Used to match description-less requests to warm-up manifest specs.
+    """
+    return (
+        normalize_component_name(spec.get("component_name", "Component")),
+        str(spec.get("type", "ui")).strip().lower(),
+        bool(spec.get("shadcn_based", True)),
+    )
+
+
+def make_spec_key(spec: dict[str, Any], model: str, prompt_version: str) -> str:
+    """
+    Build a stable cache key for a component spec.
+
+    Args:
+        spec: Component spec (component_name, description, type, shadcn_based)
+        model: LLM model name, so a model change invalidates old entries
+        prompt_version: Prompt template version, so a prompt edit invalidates old entries
+
+    Returns:
+        Hex digest identifying the spec
+    """
+    name, component_type, shadcn_based = spec_identity(spec)
+    normalized = {
+        "component_name": name,
+        "description": normalize_description(spec.get("description", "")),
+        "type": component_type,
+        "shadcn_based": shadcn_based,
+        "model": model,
+        "prompt_version": prompt_version,
+    }
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    """
+    File-backed cache of generation results, one JSON file per spec key.
+
+    Entries are written atomically, so an interrupted warm-up never leaves a
+    partial entry behind and can simply be re-run.
+    """
+
+    def __init__(self, cache_dir: str, ttl_seconds: int = 604800):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            ttl_seconds: How long an entry stays fresh
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read(self, key: str) -> Optional[dict[str, Any]]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, key: str) -> bool:
+        """Return True if an entry exists for key and has not expired."""
+        return self.get(key) is not None
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Look up a fresh cached result.
+
+        Args:
+            key: Spec key from make_spec_key
+
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        entry = self._read(key)
+        if not isinstance(entry, dict) or not isinstance(entry.get("result"), dict):
+            return None
+        created_at = entry.get("created_at")
+        if not isinstance(created_at, (int, float)):
+            return None
+        if time.time() - created_at > self.ttl_seconds:
+            return None
+        return entry["result"]
+
+    def set(self, key: str, result: dict[str, Any]) -> None:
+        """
+        Store a result atomically.
+
+        Args:
+            key: Spec key from make_spec_key
+            result: Generation result to cache
+        """
+        entry = {"created_at": time.time(), "result": result}
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
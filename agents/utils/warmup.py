@@ -0,0 +1,152 @@
+"""
+Cache Warm-up Utilities
+
+This module pre-generates components from a spec manifest into the generation
+cache, so the first users after a deploy don't wait full LLM latency for the
+most common components.
+"""
+
+import asyncio
+import json
+from typing import Any, Optional
+
+from utils.generation_cache import GenerationCache, make_spec_key
+
+
+def load_manifest(path: str) -> list[dict[str, Any]]:
+    """
+    Load component specs from a warm-up manifest.
+
+    The manifest is a JSON file holding either a list of specs or an object
+    with a "components" list. Each spec uses the same fields as a "generate"
+    request (component_name, description, type, shadcn_based).
+
+    Args:
+        path: Path to the manifest file
+
+    Returns:
+        List of component specs
+
+    Raises:
+        ValueError: If the manifest is not in the expected shape
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    specs = data.get("components") if isinstance(data, dict) else data
+    if not isinstance(specs, list) or not all(isinstance(s, dict) for s in specs):
+        raise ValueError(f"Invalid warm-up manifest: {path}")
+    return specs
+
+
+class WarmupState:
+    """
+    Progress of a warm-up run, used by /health to report readiness.
+    """
+
+    def __init__(self, total: int = 0, ready_threshold: float = 0.8):
+        """
+        Initialize warm-up state.
+
+        Args:
+            total: Number of specs in the manifest
+            ready_threshold: Fraction of specs that must be cached before ready
+        """
+        self.total = total
+        self.ready_threshold = ready_threshold
+        self.cached = 0
+        self.generated = 0
+        self.failed = 0
+        self.finished = total == 0
+
+    @property
+    def progress(self) -> float:
+        """Fraction of manifest specs currently in the cache."""
+        return self.cached / self.total if self.total else 1.0
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        Whether traffic should be accepted.
+
+        A finished run is always ready, so a failing LLM provider can't hold
+        traffic back indefinitely.
+        """
+        return self.finished or self.progress >= self.ready_threshold
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize state for the health endpoint."""
+        return {
+            "ready": self.is_ready,
+            "finished": self.finished,
+            "total": self.total,
+            "cached": self.cached,
+            "generated": self.generated,
+            "failed": self.failed,
+            "progress": round(self.progress, 3),
+            "ready_threshold": self.ready_threshold,
+        }
+
+
+async def run_warmup(
+    agent: Any,
+    specs: list[dict[str, Any]],
+    state: WarmupState,
+    concurrency: int = 4,
+) -> WarmupState:
+    """
+    Pre-generate components for specs that are not already fresh in the cache.
+
+    Results are persisted as each generation completes, so an interrupted run
+    can be resumed by running it again; fresh specs are skipped. A spec only
+    counts as cached once its entry is actually in the agent's cache.
+
+    Args:
+        agent: ComponentBuilderAgent whose cache is warmed
+        specs: Component specs from the manifest
+        state: Progress state to update
+        concurrency: Maximum number of concurrent LLM generations
+
+    Returns:
+        The updated warm-up state
+
+    Raises:
+        ValueError: If the agent has no generation cache
+    """
+    cache: Optional[GenerationCache] = agent.cache
+    if cache is None:
+        raise ValueError("Warm-up requires an agent with a generation cache")
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def warm(spec: dict[str, Any]) -> None:
+        key = make_spec_key(spec, agent.model, agent.prompt_version)
+        async with semaphore:
+            if cache.is_fresh(key):
+                state.cached += 1
+                return
+
+            try:
+                result = await agent.generate_component(
+                    component_name=spec.get("component_name", "Component"),
+                    description=spec.get("description", ""),
+                    component_type=spec.get("type", "ui"),
+                    shadcn_based=spec.get("shadcn_based", True),
+                )
+            except Exception as e:
+                result = {"error": str(e), "status": "error"}
+
+            if result.get("status") == "success" and cache.is_fresh(key):
+                state.cached += 1
+                state.generated += 1
+            else:
+                state.failed += 1
+                name = spec.get("component_name")
+                print(f"⚠️  Warm-up failed for {name}: {result.get('error', 'not cached')}")
+
+    try:
+        await asyncio.gather(*(warm(spec) for spec in specs))
+    finally:
+        state.finished = True
+
+    return state